@@ -1,12 +1,137 @@
 import tkinter as tk
 from tkinter import ttk, messagebox
-from PIL import Image, ImageTk
 import os
+import re
+import gc
+import threading
+import time
 import requests
-from io import BytesIO
-from mma_prob_model import FighterStats, win_probability, bootstrap_probability, explain
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from dataclasses import astuple
+from functools import lru_cache
 from ufc_fighter_scraper import UFCFighterScraper
 
+# Campos digitados em percentual (0-100) e convertidos para fração
+PERCENT_FIELDS = ('strike_acc', 'strike_def', 'td_acc', 'td_def')
+
+# Headers de navegador das requisições de imagem (a sessão HTTP leva só o User-Agent,
+# para o HTML do scraper continuar vindo como antes)
+IMAGE_HEADERS = {
+    'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'DNT': '1',
+    'Upgrade-Insecure-Requests': '1',
+}
+
+# Número decimal simples (ex.: "5", "5.36", ".5"); validado antes do float()
+_NUM_RE = re.compile(r'^\s*[-+]?(\d+\.?\d*|\.\d+)\s*$')
+# Prefixo de número aceito durante a digitação (ex.: "", "-", "5.", ".")
+_PARTIAL_NUM_RE = re.compile(r'^\s*[-+]?\d*\.?\d*\s*$')
+
+# Máximo de fotos/resultados de bootstrap guardados em memória (LRU) durante a sessão
+CACHE_MAX = 64
+# Os caches são lidos e gravados por várias threads do executor ao mesmo tempo
+_CACHE_LOCK = threading.Lock()
+
+# Timeout de cada variação da URL da foto e prazo total da disputa entre elas (segundos)
+IMAGE_TIMEOUT = 5
+IMAGE_DEADLINE = 6
+
+# Cache em disco dos dados do scraper (válido por uma hora entre execuções da GUI)
+SCRAPER_CACHE_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.fighter_cache.json')
+
+# PIL, NumPy e mma_prob_model são importados no primeiro uso (foto ou CALCULATE)
+# para que a janela apareça mais rápido
+
+
+def _preload_model():
+    """Importa mma_prob_model (e o NumPy) fora da thread do Tk"""
+    import importlib
+    model = importlib.import_module('mma_prob_model')
+    # Com numba, a primeira chamada compila o núcleo; melhor aqui do que no CALCULATE.
+    # Estatísticas todas float, como as que a interface monta
+    dummy = model.FighterStats(*[1.0] * len(model.STAT_FIELDS))
+    model.win_probability(dummy, dummy)
+
+
+@lru_cache(maxsize=128)
+def _cached_win_probability(t1, t2):
+    """win_probability memorizado pelas tuplas de FighterStats"""
+    from mma_prob_model import FighterStats, win_probability
+    return win_probability(FighterStats(*t1), FighterStats(*t2))
+
+
+def _is_partial_number(text):
+    """validatecommand dos campos numéricos: recusa teclas que não formam um número"""
+    return _PARTIAL_NUM_RE.match(text) is not None
+
+
+def _cache_get(cache, key):
+    """Lê do dict de cache e marca a chave como usada recentemente"""
+    with _CACHE_LOCK:
+        value = cache.pop(key, None)
+        if value is not None:
+            cache[key] = value
+    return value
+
+
+def _cache_put(cache, key, value):
+    """Grava no dict de cache descartando a entrada mais antiga acima de CACHE_MAX"""
+    with _CACHE_LOCK:
+        cache.pop(key, None)
+        cache[key] = value
+        if len(cache) > CACHE_MAX:
+            del cache[next(iter(cache))]
+
+
+def _close_response(fut):
+    """Fecha a resposta de uma variação da URL que não foi usada"""
+    if not fut.cancelled() and fut.exception() is None:
+        fut.result().close()
+
+
+@lru_cache(maxsize=1)
+def _check_pillow_features():
+    """Avisa uma única vez se o Pillow instalado não decodifica JPEG com libjpeg-turbo"""
+    from PIL import features
+    try:
+        turbo = bool(features.check_feature('libjpeg_turbo'))
+    except ValueError:
+        # Versões antigas do Pillow não conhecem essa feature
+        turbo = False
+    if not turbo:
+        print("Aviso: Pillow sem libjpeg-turbo; as fotos vão decodificar mais devagar (veja 'Desempenho' no README)")
+    return turbo
+
+
+def _fit_to_slot(image, width, height):
+    """Reduz `image` no lugar para caber em width x height, mantendo a proporção"""
+    from PIL import Image
+    _check_pillow_features()
+    # Em JPEG o draft faz o libjpeg já decodificar reduzido (escala DCT 1/2, 1/4 ou 1/8)
+    image.draft('RGB', (width * 2, height * 2))
+    # BILINEAR basta para a miniatura; LANCZOS só para entradas enormes (ex.: PNG sem draft)
+    resample = Image.Resampling.LANCZOS if image.width > 2000 else Image.Resampling.BILINEAR
+    image.thumbnail((width, height), resample)
+    return image
+
+
+def _stream_bootstrap(t1, t2, buf, progress, cancel, noise, rng, chunk=20):
+    """Preenche `buf` com amostras do bootstrap; `progress[0]` guarda quantas já existem"""
+    from mma_prob_model import FighterStats, bootstrap_samples
+    fighter1, fighter2 = FighterStats(*t1), FighterStats(*t2)
+    # Blocos vetorizados (NumPy) de `chunk` amostras, checando o cancelamento entre eles
+    for start in range(0, len(buf), chunk):
+        if cancel.is_set():
+            break
+        stop = min(start + chunk, len(buf))
+        buf[start:stop] = bootstrap_samples(fighter1, fighter2, iters=stop - start, noise=noise, rng=rng)
+        progress[0] = stop
+    return progress[0]
+
+
 class MMAAnalyzerGUI:
     def __init__(self, root):
         self.root = root
@@ -17,15 +142,87 @@ class MMAAnalyzerGUI:
         # Variáveis para armazenar as imagens dos lutadores
         self.fighter1_image = None
         self.fighter2_image = None
+        # Geração da foto de cada lado: cada busca/upload incrementa, e um download
+        # que termina depois de uma busca/upload mais recente é descartado
+        self._photo_gen = {1: 0, 2: 0}
+        
+        # Modelo do fundo das fotos (144x244), criado no primeiro uso e copiado a cada foto
+        self._photo_bg_template = None
+        
+        # Sessão HTTP única (conexões keep-alive + retries) para o scraper e as fotos;
+        # User-Agent para evitar bloqueios 403
+        self.http = requests.Session()
+        self.http.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+        })
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                              max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504]))
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        
+        # Inicializar scraper (mesma sessão)
+        self.scraper = UFCFighterScraper(session=self.http, cache_file=SCRAPER_CACHE_FILE)
+        
+        # Executor para trabalho pesado fora do loop do Tk (bootstrap, scraping, fotos)
+        self._executor = ThreadPoolExecutor(max_workers=4)
+        # Pool separado para as variações da URL da foto (disparadas de dentro de uma tarefa do executor)
+        self._image_executor = ThreadPoolExecutor(max_workers=4)
+        
+        # Gerador NumPy criado uma única vez (na primeira análise); o estado inicial
+        # é restaurado a cada análise para que entradas iguais gerem o mesmo intervalo
+        self._rng = None
+        self._rng_state = None
+        # Sinal de parada do bootstrap em andamento (trocado a cada análise)
+        self._cancel_event = threading.Event()
+        
+        # Cache em memória das fotos prontas (144x244) por URL; os dados dos lutadores
+        # ficam no cache do scraper (com validade)
+        self._image_cache = {}
+        # Resultado do bootstrap completo por par de estatísticas, e a última entrada exibida
+        self._bootstrap_cache = {}
+        self._last_input = None
+        
+        # Estilos ttk dos frames de layout: cores registradas uma única vez
+        style = ttk.Style(self.root)
+        style.configure('Dark.TFrame', background='#2c3e50')
+        style.configure('Panel.TFrame', background='#34495e')
+        
+        # Tooltip único e reutilizado (apenas escondido/mostrado)
+        self._tooltip = tk.Toplevel(self.root)
+        self._tooltip.wm_overrideredirect(True)
+        self._tooltip.withdraw()
+        self._tooltip_label = tk.Label(self._tooltip, 
+                                       font=("Arial", 9),
+                                       bg="#f39c12", fg="white",
+                                       wraplength=200)
+        self._tooltip_label.pack()
+        # Texto do tooltip de cada widget (handlers compartilhados, sem closures)
+        self._tooltip_texts = {}
         
-        # Inicializar scraper
-        self.scraper = UFCFighterScraper()
+        # Validador único, registrado uma vez, compartilhado por todos os campos numéricos
+        self._number_vcmd = (self.root.register(_is_partial_number), '%P')
         
         self.setup_ui()
+        
+        # Ao fechar a janela, liberar de uma vez os buffers do Pillow que sobraram
+        self.root.bind('<Destroy>', self._on_root_destroy)
+        
+        # Com a janela já desenhada, pré-carregar o modelo (e o NumPy) numa thread de trabalho,
+        # para que o primeiro CALCULATE não pague o import na thread do Tk
+        self.root.after_idle(self._executor.submit, _preload_model)
+    
+    def _on_root_destroy(self, event):
+        # <Destroy> da raiz também dispara para cada widget filho
+        if event.widget is self.root:
+            # Sem esperar downloads/bootstrap em andamento: o processo fecha junto com a janela
+            self._cancel_event.set()
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._image_executor.shutdown(wait=False, cancel_futures=True)
+            gc.collect()
     
     def setup_ui(self):
         # Frame principal
-        main_frame = tk.Frame(self.root, bg='#2c3e50')
+        main_frame = ttk.Frame(self.root, style='Dark.TFrame')
         main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=(40, 20))  # 20px a mais no topo
         
         # Título
@@ -35,20 +232,20 @@ class MMAAnalyzerGUI:
         title_label.pack(pady=(0, 30))
         
         # Frame central com os lutadores
-        center_frame = tk.Frame(main_frame, bg='#2c3e50')
+        center_frame = ttk.Frame(main_frame, style='Dark.TFrame')
         center_frame.pack(fill=tk.BOTH, expand=True)
         
         # Frame esquerdo completo (Inputs do Lutador 1)
-        left_section = tk.Frame(center_frame, bg='#2c3e50')
+        left_section = ttk.Frame(center_frame, style='Dark.TFrame')
         left_section.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 10))
         
         # Frame central para fotos e VS (layout horizontal)
-        center_photos_frame = tk.Frame(center_frame, bg='#2c3e50', width=600)
+        center_photos_frame = ttk.Frame(center_frame, style='Dark.TFrame', width=600)
         center_photos_frame.pack(side=tk.LEFT, fill=tk.Y, padx=10)
         center_photos_frame.pack_propagate(False)
         
         # Frame direito completo (Inputs do Lutador 2)
-        right_section = tk.Frame(center_frame, bg='#2c3e50')
+        right_section = ttk.Frame(center_frame, style='Dark.TFrame')
         right_section.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(10, 0))
         
         # Configurar lutador 1 (esquerda - apenas inputs)
@@ -61,7 +258,7 @@ class MMAAnalyzerGUI:
         self.setup_fighter_inputs(right_section, "FIGHTER 2", 2)
         
         # Frame para resultados detalhados
-        results_frame = tk.Frame(main_frame, bg='#2c3e50')
+        results_frame = ttk.Frame(main_frame, style='Dark.TFrame')
         results_frame.pack(fill=tk.X, pady=(30, 0))
         
         # Label para análise detalhada
@@ -71,8 +268,25 @@ class MMAAnalyzerGUI:
         self.detailed_label.pack(pady=10)
         
         # Frame para contribuições
-        self.contrib_frame = tk.Frame(results_frame, bg='#2c3e50')
+        self.contrib_frame = ttk.Frame(results_frame, style='Dark.TFrame')
         self.contrib_frame.pack(fill=tk.X, pady=10)
+        
+        # Título e botão das contribuições: criados uma vez, exibidos após a primeira análise
+        self.contrib_title = tk.Label(self.contrib_frame, text="Feature Contributions (click for details):", 
+                                      font=("Arial", 12, "bold"),
+                                      fg='#ecf0f1', bg='#2c3e50')
+        
+        # Botão para mostrar/ocultar contribuições detalhadas
+        self.show_details_btn = tk.Button(self.contrib_frame, text="Show Detailed Analysis", 
+                                         font=("Arial", 10),
+                                         bg='#3498db', fg='white',
+                                         command=self.toggle_contributions)
+        
+        # Painel das contribuições detalhadas: só é criado na primeira vez que
+        # o usuário pede para vê-lo, e depois reaproveitado
+        self.contrib_details_frame = None
+        self._contrib = {}
+        self.contrib_visible = False
     
     def setup_fighter_inputs(self, parent, title, fighter_num):
         # Frame com borda escura para os inputs
@@ -86,14 +300,14 @@ class MMAAnalyzerGUI:
         title_label.pack(pady=(10, 5))
         
         # Frame para URL do lutador
-        url_frame = tk.Frame(inputs_frame, bg='#34495e')
+        url_frame = ttk.Frame(inputs_frame, style='Panel.TFrame')
         url_frame.pack(fill=tk.X, padx=20, pady=5)
         
         tk.Label(url_frame, text="Fighter URL:", font=("Arial", 10, "bold"),
                 fg='#ecf0f1', bg='#34495e').pack(anchor=tk.W)
         
         # Container para URL e botão
-        url_container = tk.Frame(url_frame, bg='#34495e')
+        url_container = ttk.Frame(url_frame, style='Panel.TFrame')
         url_container.pack(fill=tk.X, pady=2)
         
         url_entry = tk.Entry(url_container, font=("Arial", 10))
@@ -106,21 +320,21 @@ class MMAAnalyzerGUI:
         search_btn.pack(side=tk.RIGHT)
         
         # Frame para nome
-        name_frame = tk.Frame(inputs_frame, bg='#34495e')
+        name_frame = ttk.Frame(inputs_frame, style='Panel.TFrame')
         name_frame.pack(fill=tk.X, padx=20, pady=5)
         
         tk.Label(name_frame, text="Fighter Name:", font=("Arial", 10, "bold"),
                 fg='#ecf0f1', bg='#34495e').pack(anchor=tk.CENTER)
         
         # Container para centralizar o campo de nome
-        name_container = tk.Frame(name_frame, bg='#34495e')
+        name_container = ttk.Frame(name_frame, style='Panel.TFrame')
         name_container.pack(fill=tk.X, pady=2)
         
         name_entry = tk.Entry(name_container, font=("Arial", 12), width=25, justify='center')
         name_entry.pack(anchor=tk.CENTER)
         
         # Frame principal para estatísticas
-        stats_main_frame = tk.Frame(inputs_frame, bg='#34495e')
+        stats_main_frame = ttk.Frame(inputs_frame, style='Panel.TFrame')
         stats_main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=0)
         
         # Criar campos de entrada para estatísticas organizados em seções
@@ -145,69 +359,80 @@ class MMAAnalyzerGUI:
         ]
         
         entries = {}
+        stat_vars = {}
         
+        # Ordem dos campos igual à de FighterStats: (campo, é percentual?)
+        self._field_spec = [(field_name, field_name in PERCENT_FIELDS)
+                            for _, fields in stats_fields for _, field_name, _ in fields]
+        
+        # Grade única por lutador: títulos de seção, separadores, rótulos e campos
+        stats_grid = ttk.Frame(stats_main_frame, style='Panel.TFrame')
+        stats_grid.pack(fill=tk.X, padx=10)
+        
+        # Configurar colunas para expandir igualmente (uma única chamada, fora do loop dos campos)
+        stats_grid.grid_columnconfigure((0, 1), weight=1, uniform='stats')
+        
+        row = 0
         for section_title, fields in stats_fields:
             # Seção título
-            section_frame = tk.Frame(stats_main_frame, bg='#34495e')
-            section_frame.pack(fill=tk.X, pady=(15, 5))
-            
-            section_label = tk.Label(section_frame, text=section_title, 
+            section_label = tk.Label(stats_grid, text=section_title, 
                                    font=("Arial", 11, "bold"),
                                    fg='#3498db', bg='#34495e')
-            section_label.pack()
+            section_label.grid(row=row, column=0, columnspan=2, pady=(15, 0))
             
             # Separador visual
-            separator = tk.Frame(section_frame, height=1, bg='#3498db')
-            separator.pack(fill=tk.X, padx=20, pady=2)
-            
-            # Campos da seção em grid 2x2
-            grid_frame = tk.Frame(stats_main_frame, bg='#34495e')
-            grid_frame.pack(fill=tk.X, padx=10, pady=5)
+            separator = tk.Frame(stats_grid, height=1, bg='#3498db')
+            separator.grid(row=row + 1, column=0, columnspan=2, sticky="ew", padx=10, pady=(2, 7))
+            row += 2
             
+            # Campos da seção em 2 colunas (rótulo numa linha, entrada na seguinte)
             for i, (label_text, field_name, tooltip) in enumerate(fields):
-                row = i // 2
+                field_row = row + (i // 2) * 2
                 col = i % 2
                 
-                field_frame = tk.Frame(grid_frame, bg='#34495e')
-                field_frame.grid(row=row, column=col, sticky="ew", padx=5, pady=3)
-                
-                # Configurar colunas para expandir igualmente
-                grid_frame.grid_columnconfigure(0, weight=1)
-                grid_frame.grid_columnconfigure(1, weight=1)
-                
-                label = tk.Label(field_frame, text=label_text, 
+                label = tk.Label(stats_grid, text=label_text, 
                                font=("Arial", 9, "bold"),
                                fg='#ecf0f1', bg='#34495e')
-                label.pack(anchor=tk.W)
+                label.grid(row=field_row, column=col, sticky="w", padx=5, pady=(3, 0))
                 
-                entry = tk.Entry(field_frame, font=("Arial", 10), width=15)
-                entry.pack(fill=tk.X, pady=2)
+                # StringVar: a leitura no CALCULATE não passa pelo "$w get" do widget
+                var = tk.StringVar(self.root)
+                entry = tk.Entry(stats_grid, font=("Arial", 10), width=15, textvariable=var,
+                                 validate='key', validatecommand=self._number_vcmd)
+                entry.grid(row=field_row + 1, column=col, sticky="ew", padx=5, pady=(2, 3))
                 entries[field_name] = entry
+                stat_vars[field_name] = var
                 
                 # Tooltip
                 self.create_tooltip(entry, tooltip)
+            
+            row += (len(fields) + 1) // 2 * 2
         
         # Armazenar referências
         if fighter_num == 1:
             self.fighter1_entries = entries
+            self.fighter1_vars = stat_vars
             self.fighter1_name = name_entry
             self.fighter1_url = url_entry
+            self.fighter1_search_btn = search_btn
         else:
             self.fighter2_entries = entries
+            self.fighter2_vars = stat_vars
             self.fighter2_name = name_entry
             self.fighter2_url = url_entry
+            self.fighter2_search_btn = search_btn
     
     def setup_center_photos_vs(self, parent):
         # Frame principal para centralização completa
-        main_center_frame = tk.Frame(parent, bg='#2c3e50')
+        main_center_frame = ttk.Frame(parent, style='Dark.TFrame')
         main_center_frame.pack(expand=True, fill=tk.BOTH)
         
         # Frame para organizar horizontalmente: Foto1, VS+Probs+Button, Foto2
-        content_frame = tk.Frame(main_center_frame, bg='#2c3e50')
+        content_frame = ttk.Frame(main_center_frame, style='Dark.TFrame')
         content_frame.place(relx=0.5, rely=0.5, anchor=tk.CENTER)  # Centralização absoluta
         
         # Foto do Fighter 1 (esquerda do VS) - centralizada verticalmente
-        photo1_frame = tk.Frame(content_frame, bg='#2c3e50')
+        photo1_frame = ttk.Frame(content_frame, style='Dark.TFrame')
         photo1_frame.pack(side=tk.LEFT, padx=(0, 30))
         
         # Centralizar label do fighter 1
@@ -230,24 +455,26 @@ class MMAAnalyzerGUI:
         self.fighter1_image_label.bind("<Button-1>", lambda e: self.add_fighter_image(1, self.fighter1_image_label))
         
         # Labels abaixo da foto do Fighter 1 (inicialmente vazios)
-        self.fighter1_name_result = tk.Label(photo1_frame, text="", 
+        self.fighter1_name_text = tk.StringVar(self.root)
+        self.fighter1_name_result = tk.Label(photo1_frame, textvariable=self.fighter1_name_text, 
                                            font=("Arial", 12, "bold"),
                                            fg='#ecf0f1', bg='#2c3e50',
                                            anchor=tk.CENTER)
         self.fighter1_name_result.pack(pady=(10, 2))
         
-        self.fighter1_prob_result = tk.Label(photo1_frame, text="", 
+        self.fighter1_prob_text = tk.StringVar(self.root)
+        self.fighter1_prob_result = tk.Label(photo1_frame, textvariable=self.fighter1_prob_text, 
                                            font=("Arial", 16, "bold"),
                                            fg='#27ae60', bg='#2c3e50',
                                            anchor=tk.CENTER)
         self.fighter1_prob_result.pack(pady=2)
         
         # Seção VS central com probabilidades - perfeitamente centralizada
-        vs_frame = tk.Frame(content_frame, bg='#2c3e50')
+        vs_frame = ttk.Frame(content_frame, style='Dark.TFrame')
         vs_frame.pack(side=tk.LEFT, padx=40)
         
         # Container para centralizar todos os elementos do VS
-        vs_content = tk.Frame(vs_frame, bg='#2c3e50')
+        vs_content = ttk.Frame(vs_frame, style='Dark.TFrame')
         vs_content.pack(expand=True, fill=tk.BOTH)
         
         # Label VS no centro absoluto
@@ -265,15 +492,24 @@ class MMAAnalyzerGUI:
                                     height=2, width=12)
         self.analyze_btn.pack(pady=15)
         
+        # Botão para interromper o bootstrap em andamento
+        self.cancel_btn = tk.Button(vs_content, text="CANCEL", 
+                                   font=("Arial", 9, "bold"),
+                                   bg='#7f8c8d', fg='white',
+                                   command=self.cancel_analysis,
+                                   state=tk.DISABLED, width=12)
+        self.cancel_btn.pack()
+        
         # Label para intervalo de confiança - centralizado
-        self.confidence_label = tk.Label(vs_content, text="", 
+        self.confidence_text = tk.StringVar(self.root)
+        self.confidence_label = tk.Label(vs_content, textvariable=self.confidence_text, 
                                         font=("Arial", 9),
                                         fg='#bdc3c7', bg='#2c3e50',
                                         anchor=tk.CENTER)
         self.confidence_label.pack(pady=(10, 50))
         
         # Foto do Fighter 2 (direita do VS) - centralizada verticalmente
-        photo2_frame = tk.Frame(content_frame, bg='#2c3e50')
+        photo2_frame = ttk.Frame(content_frame, style='Dark.TFrame')
         photo2_frame.pack(side=tk.LEFT, padx=(30, 0))
         
         # Centralizar label do fighter 2
@@ -296,37 +532,42 @@ class MMAAnalyzerGUI:
         self.fighter2_image_label.bind("<Button-1>", lambda e: self.add_fighter_image(2, self.fighter2_image_label))
         
         # Labels abaixo da foto do Fighter 2 (inicialmente vazios)
-        self.fighter2_name_result = tk.Label(photo2_frame, text="", 
+        self.fighter2_name_text = tk.StringVar(self.root)
+        self.fighter2_name_result = tk.Label(photo2_frame, textvariable=self.fighter2_name_text, 
                                            font=("Arial", 12, "bold"),
                                            fg='#ecf0f1', bg='#2c3e50',
                                            anchor=tk.CENTER)
         self.fighter2_name_result.pack(pady=(10, 2))
         
-        self.fighter2_prob_result = tk.Label(photo2_frame, text="", 
+        self.fighter2_prob_text = tk.StringVar(self.root)
+        self.fighter2_prob_result = tk.Label(photo2_frame, textvariable=self.fighter2_prob_text, 
                                            font=("Arial", 16, "bold"),
                                            fg='#27ae60', bg='#2c3e50',
                                            anchor=tk.CENTER)
         self.fighter2_prob_result.pack(pady=2)
     
     def create_tooltip(self, widget, text):
-        def on_enter(event):
-            tooltip = tk.Toplevel()
-            tooltip.wm_overrideredirect(True)
-            tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
-            label = tk.Label(tooltip, text=text, 
-                           font=("Arial", 9),
-                           bg="#f39c12", fg="white",
-                           wraplength=200)
-            label.pack()
-            widget.tooltip = tooltip
-        
-        def on_leave(event):
-            if hasattr(widget, 'tooltip'):
-                widget.tooltip.destroy()
-                del widget.tooltip
-        
-        widget.bind("<Enter>", on_enter)
-        widget.bind("<Leave>", on_leave)
+        self._tooltip_texts[widget] = text
+        widget.bind("<Enter>", self._on_tooltip_enter)
+        widget.bind("<Leave>", self._on_tooltip_leave)
+    
+    def _on_tooltip_enter(self, event):
+        # Reconfigura o texto só quando muda (evita recalcular o layout do label)
+        text = self._tooltip_texts[event.widget]
+        if self._tooltip_label.cget('text') != text:
+            self._tooltip_label.configure(text=text)
+        self._tooltip.wm_geometry(f"+{event.x_root+10}+{event.y_root+10}")
+        self._tooltip.deiconify()
+    
+    def _on_tooltip_leave(self, event):
+        self._tooltip.withdraw()
+    
+    def _when_done(self, fut, callback, *args):
+        """Chama `callback(fut, *args)` na thread do Tk assim que o future terminar"""
+        if not fut.done():
+            self.root.after(50, self._when_done, fut, callback, *args)
+            return
+        callback(fut, *args)
     
     def search_fighter(self, fighter_num, url):
         """Buscar dados do lutador pela URL usando o scraper"""
@@ -334,20 +575,43 @@ class MMAAnalyzerGUI:
             messagebox.showwarning("Warning", "Please enter a fighter URL")
             return
         
+        # Mostrar indicador de carregamento e bloquear novos cliques até terminar
+        if fighter_num == 1:
+            self.fighter1_name.delete(0, tk.END)
+            self.fighter1_name.insert(0, "Loading...")
+            self.fighter1_search_btn.configure(state=tk.DISABLED)
+        else:
+            self.fighter2_name.delete(0, tk.END)
+            self.fighter2_name.insert(0, "Loading...")
+            self.fighter2_search_btn.configure(state=tk.DISABLED)
+        
+        # Só redesenhar (sem despachar novos eventos, como o update() fazia)
+        self.root.update_idletasks()
+        
+        # Buscar dados do lutador numa thread de trabalho; a interface continua respondendo
+        self._photo_gen[fighter_num] += 1
+        fut = self._executor.submit(self._fetch_fighter_data, url)
+        self._when_done(fut, self._apply_fighter_data, fighter_num, self._photo_gen[fighter_num])
+    
+    def _fetch_fighter_data(self, url):
+        """Dados do lutador (o scraper cuida do cache) e download da foto já iniciado (fora da thread do Tk)"""
+        fighter_data = self.scraper.get_fighter_data(url)
+        
+        # A foto começa a baixar já, em paralelo com o preenchimento dos campos na interface
+        image_future = None
+        if fighter_data and fighter_data.get('image_url'):
+            image_future = self._executor.submit(self._download_and_compose_image, fighter_data['image_url'])
+        return fighter_data, image_future
+    
+    def _apply_fighter_data(self, fut, fighter_num, photo_gen):
+        """Preencher os campos com os dados do scraper (thread do Tk)"""
+        if fighter_num == 1:
+            self.fighter1_search_btn.configure(state=tk.NORMAL)
+        else:
+            self.fighter2_search_btn.configure(state=tk.NORMAL)
+        
         try:
-            # Mostrar indicador de carregamento
-            if fighter_num == 1:
-                self.fighter1_name.delete(0, tk.END)
-                self.fighter1_name.insert(0, "Loading...")
-            else:
-                self.fighter2_name.delete(0, tk.END)
-                self.fighter2_name.insert(0, "Loading...")
-            
-            # Atualizar interface
-            self.root.update()
-            
-            # Buscar dados do lutador
-            fighter_data = self.scraper.get_fighter_data(url)
+            fighter_data, image_future = fut.result()
             
             if not fighter_data or 'name' not in fighter_data:
                 messagebox.showerror("Error", "Could not extract fighter data from the URL")
@@ -387,14 +651,14 @@ class MMAAnalyzerGUI:
                     entry.delete(0, tk.END)
                     if value is not None:
                         # Converter frações para percentuais se necessário
-                        if field_name in ['strike_acc', 'strike_def', 'td_acc', 'td_def']:
+                        if field_name in PERCENT_FIELDS:
                             if isinstance(value, (int, float)) and value <= 1.0:
                                 value = value * 100
                         entry.insert(0, f"{value:.2f}" if isinstance(value, float) else str(value))
             
-            # Carregar imagem se disponível
-            if fighter_data.get('image_url'):
-                self.load_fighter_image_from_url(fighter_num, fighter_data['image_url'], image_label)
+            # Exibir imagem quando o download (já em andamento) terminar
+            if image_future is not None:
+                self._when_done(image_future, self._show_downloaded_image, fighter_num, image_label, photo_gen)
             else:
                 print("Nenhuma URL de imagem encontrada para este lutador")
             
@@ -409,105 +673,155 @@ class MMAAnalyzerGUI:
             
             messagebox.showerror("Error", f"Failed to load fighter data: {str(e)}")
     
-    def load_fighter_image_from_url(self, fighter_num, image_url, label):
-        """Carregar imagem do lutador a partir de uma URL"""
-        try:
-            # Headers para evitar bloqueios 403
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Accept': 'image/webp,image/apng,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'DNT': '1',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1',
-            }
-            
-            # Tentar diferentes variações da URL se necessário
-            urls_to_try = [image_url]
-            
-            # Se a URL contém parâmetros, tentar sem eles
-            if '?' in image_url:
-                base_url = image_url.split('?')[0]
-                urls_to_try.append(base_url)
-            
-            # Se é uma URL da UFC, tentar versões alternativas
-            if 'ufc.com' in image_url:
-                # Tentar versão sem itok
-                if 'itok=' in image_url:
-                    clean_url = image_url.split('?itok=')[0]
-                    urls_to_try.append(clean_url)
-                
-                # Tentar versão com .com.br
-                if '.com/' in image_url:
-                    br_url = image_url.replace('.com/', '.com.br/')
-                    urls_to_try.append(br_url)
+    def _photo_background(self):
+        """Cópia do fundo escuro 144x244 das fotos (memcpy em vez de preencher pixel a pixel)"""
+        from PIL import Image
+        
+        if self._photo_bg_template is None:
+            self._photo_bg_template = Image.new('RGB', (144, 244), '#34495e')
+        return self._photo_bg_template.copy()
+    
+    def _compose_photo(self, image_resized, container_width=144, container_height=244):
+        """Centralizar a foto já reduzida sobre o fundo escuro do container"""
+        new_width, new_height = image_resized.size
+        
+        # Foto RGB que já preenche o container inteiro: dispensa o fundo e o paste
+        if image_resized.mode == 'RGB' and new_width == container_width and new_height == container_height:
+            return image_resized
+        
+        # Criar uma imagem com fundo escuro da interface
+        final_image = self._photo_background()
+        paste_x = (container_width - new_width) // 2
+        paste_y = (container_height - new_height) // 2
+        
+        # Se a imagem tem transparência (canal alpha), compor corretamente com o fundo;
+        # JPEG opaco (RGB) pula a verificação
+        if image_resized.mode != 'RGB' and (image_resized.mode in ('RGBA', 'LA') or (image_resized.mode == 'P' and 'transparency' in image_resized.info)):
+            # Converter para RGBA se necessário
+            if image_resized.mode != 'RGBA':
+                image_resized = image_resized.convert('RGBA')
             
-            image = None
-            successful_url = None
+            # Colar usando o alpha como máscara: mistura direto sobre o fundo escuro
+            final_image.paste(image_resized, (paste_x, paste_y), image_resized)
+        else:
+            final_image.paste(image_resized, (paste_x, paste_y))
+        return final_image
+    
+    def _download_and_compose_image(self, image_url):
+        """Baixar a foto e montar a imagem final 144x244 (roda fora da thread do Tk;
+        o PhotoImage é criado depois, na thread do Tk)"""
+        from PIL import Image
+        
+        # Foto já baixada e composta nesta sessão: pula download, decodificação e resize
+        cached = _cache_get(self._image_cache, image_url)
+        if cached is not None:
+            return cached
+        
+        # Tentar diferentes variações da URL se necessário
+        urls_to_try = [image_url]
+        
+        # Se a URL contém parâmetros, tentar sem eles
+        if '?' in image_url:
+            base_url = image_url.split('?')[0]
+            urls_to_try.append(base_url)
+        
+        # Se é uma URL da UFC, tentar versões alternativas
+        if 'ufc.com' in image_url:
+            # Tentar versão sem itok
+            if 'itok=' in image_url:
+                clean_url = image_url.split('?itok=')[0]
+                urls_to_try.append(clean_url)
             
-            # Tentar cada URL até encontrar uma que funcione
-            for url in urls_to_try:
+            # Tentar versão com .com.br
+            if '.com/' in image_url:
+                br_url = image_url.replace('.com/', '.com.br/')
+                urls_to_try.append(br_url)
+        
+        image = None
+        
+        # Disparar todas as variações ao mesmo tempo; vale a primeira que responder 200
+        # (o tempo total fica no máximo dos timeouts, não na soma)
+        futures = {}
+        for url in dict.fromkeys(urls_to_try):
+            print(f"Tentando carregar imagem de: {url}")
+            fut = self._image_executor.submit(self.http.get, url, headers=IMAGE_HEADERS,
+                                              timeout=IMAGE_TIMEOUT, stream=True)
+            futures[fut] = url
+        
+        pending = set(futures)
+        deadline = time.monotonic() + IMAGE_DEADLINE
+        while pending and image is None:
+            done, pending = wait(pending, timeout=max(0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for fut in done:
+                url = futures[fut]
                 try:
-                    print(f"Tentando carregar imagem de: {url}")
-                    response = requests.get(url, headers=headers, timeout=15, stream=True)
-                    
-                    if response.status_code == 200:
-                        image = Image.open(BytesIO(response.content))
-                        successful_url = url
+                    response = fut.result()
+                    if image is None and response.status_code == 200:
+                        # Abrir a partir de response.raw (o Pillow copia o corpo inteiro para um
+                        # BytesIO, pois o stream não é seekable); o draft antes do load() faz o
+                        # libjpeg já reduzir a escala (IDCT 1/2, 1/4) na decodificação
+                        try:
+                            response.raw.decode_content = True
+                            decoded = Image.open(response.raw)
+                            decoded.draft('RGB', (144 * 2, 244 * 2))
+                            decoded.load()
+                        finally:
+                            # stream=True só devolve o socket ao pool da sessão quando fechado
+                            response.close()
+                        image = decoded
                         print(f"Imagem carregada com sucesso de: {url}")
-                        break
                     else:
-                        print(f"Erro {response.status_code} para URL: {url}")
-                        
+                        if response.status_code != 200:
+                            print(f"Erro {response.status_code} para URL: {url}")
+                        response.close()
+                
                 except requests.exceptions.RequestException as e:
                     print(f"Erro de request para {url}: {str(e)}")
-                    continue
                 except Exception as e:
                     print(f"Erro ao processar {url}: {str(e)}")
-                    continue
-            
-            if image is None:
-                print("Nenhuma URL de imagem funcionou")
+        
+        # Variações que ainda não responderam: cancelar ou fechar quando chegarem
+        for fut in pending:
+            if not fut.cancel():
+                fut.add_done_callback(_close_response)
+        
+        if image is None:
+            print("Nenhuma URL de imagem funcionou")
+            return None
+        
+        # Redimensionar para o container
+        container_width = 144
+        container_height = 244
+        
+        image_resized = _fit_to_slot(image, container_width, container_height)
+        final_image = self._compose_photo(image_resized)
+        # Liberar a foto decodificada já, sem esperar o fim da função/GC
+        del image, image_resized
+        _cache_put(self._image_cache, image_url, final_image)
+        return final_image
+    
+    def _show_downloaded_image(self, fut, fighter_num, label, photo_gen):
+        """Exibir a foto baixada (thread do Tk)"""
+        from PIL import ImageTk
+        
+        # Já houve outra busca ou upload neste lado: esta foto ficou velha
+        if photo_gen != self._photo_gen[fighter_num]:
+            return
+        
+        try:
+            final_image = fut.result()
+            if final_image is None:
                 return
             
-            # Redimensionar para o container
-            container_width = 144
-            container_height = 244
-            
-            img_width, img_height = image.size
-            scale_w = container_width / img_width
-            scale_h = container_height / img_height
-            scale = min(scale_w, scale_h)
-            
-            new_width = int(img_width * scale)
-            new_height = int(img_height * scale)
-            
-            image_resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-            
-            # Criar imagem final com fundo escuro
-            final_image = Image.new('RGB', (container_width, container_height), '#34495e')
-            paste_x = (container_width - new_width) // 2
-            paste_y = (container_height - new_height) // 2
-            
-            # Tratar transparência se necessário
-            if image_resized.mode in ('RGBA', 'LA') or (image_resized.mode == 'P' and 'transparency' in image_resized.info):
-                if image_resized.mode != 'RGBA':
-                    image_resized = image_resized.convert('RGBA')
-                
-                temp_bg = Image.new('RGBA', (new_width, new_height), '#34495e')
-                composed = Image.alpha_composite(temp_bg, image_resized)
-                image_resized = composed.convert('RGB')
-            
-            final_image.paste(image_resized, (paste_x, paste_y))
-            
             photo = ImageTk.PhotoImage(final_image)
             
             # Atualizar label
             label.configure(image=photo, text="")
-            label.image = photo
             
-            # Armazenar imagem
+            # Armazenar imagem (única referência que impede o GC do PhotoImage)
             if fighter_num == 1:
                 self.fighter1_image = photo
             else:
@@ -521,6 +835,7 @@ class MMAAnalyzerGUI:
     
     def add_fighter_image(self, fighter_num, label):
         from tkinter import filedialog
+        from PIL import Image, ImageTk
         
         filename = filedialog.askopenfilename(
             title=f"Select Fighter {fighter_num} Photo",
@@ -528,53 +843,26 @@ class MMAAnalyzerGUI:
         )
         
         if filename:
+            # Download de uma busca anterior não deve sobrescrever a foto escolhida
+            self._photo_gen[fighter_num] += 1
             try:
-                # Carregar imagem original
-                image = Image.open(filename)
-                
                 # Redimensionar para o container 150x250 (deixar 3px de margem: 144x244)
                 container_width = 144
                 container_height = 244
                 
-                # Calcular redimensionamento mantendo proporção
-                img_width, img_height = image.size
-                scale_w = container_width / img_width
-                scale_h = container_height / img_height
-                scale = min(scale_w, scale_h)  # Usar a menor escala para manter dentro dos limites
-                
-                new_width = int(img_width * scale)
-                new_height = int(img_height * scale)
-                
-                # Redimensionar a imagem
-                image_resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
-                
-                # Criar uma imagem com fundo escuro da interface
-                final_image = Image.new('RGB', (container_width, container_height), '#34495e')
-                paste_x = (container_width - new_width) // 2
-                paste_y = (container_height - new_height) // 2
-                
-                # Se a imagem tem transparência (canal alpha), compor corretamente com o fundo
-                if image_resized.mode in ('RGBA', 'LA') or (image_resized.mode == 'P' and 'transparency' in image_resized.info):
-                    # Converter para RGBA se necessário
-                    if image_resized.mode != 'RGBA':
-                        image_resized = image_resized.convert('RGBA')
-                    
-                    # Criar uma imagem temporária com fundo escuro para composição
-                    temp_bg = Image.new('RGBA', (new_width, new_height), '#34495e')
-                    # Compor a imagem com transparência sobre o fundo escuro
-                    composed = Image.alpha_composite(temp_bg, image_resized)
-                    # Converter para RGB
-                    image_resized = composed.convert('RGB')
-                
-                final_image.paste(image_resized, (paste_x, paste_y))
+                # Carregar imagem original e redimensionar mantendo proporção
+                image = Image.open(filename)
+                image_resized = _fit_to_slot(image, container_width, container_height)
+                final_image = self._compose_photo(image_resized)
+                del image, image_resized
                 
                 photo = ImageTk.PhotoImage(final_image)
+                del final_image
                 
                 # Atualizar label
                 label.configure(image=photo, text="")
-                label.image = photo  # Manter referência
                 
-                # Armazenar imagem
+                # Armazenar imagem (única referência que impede o GC do PhotoImage)
                 if fighter_num == 1:
                     self.fighter1_image = photo
                 else:
@@ -583,121 +871,216 @@ class MMAAnalyzerGUI:
             except Exception as e:
                 messagebox.showerror("Error", f"Could not load image: {str(e)}")
     
-    def get_fighter_stats(self, entries):
-        """Extrair estatísticas dos campos de entrada"""
+    def get_fighter_stats(self, stat_vars):
+        """Extrair estatísticas das variáveis ligadas aos campos de entrada"""
+        from mma_prob_model import FighterStats
+        
         try:
-            stats = {}
-            for field, entry in entries.items():
-                value = entry.get().strip()
-                if not value:
-                    raise ValueError(f"Field '{field}' is empty")
+            values = [0.0] * len(self._field_spec)
+            for i, (field, is_pct) in enumerate(self._field_spec):
+                value = stat_vars[field].get()
+                if not _NUM_RE.match(value):
+                    if not value.strip():
+                        raise ValueError(f"Field '{field}' is empty")
+                    raise ValueError(f"Field '{field}' is not a number: {value.strip()!r}")
                 
                 # Converter percentuais para decimais se necessário
-                if field in ['strike_acc', 'strike_def', 'td_acc', 'td_def']:
-                    stats[field] = float(value) / 100.0 if float(value) > 1.0 else float(value)
-                else:
-                    stats[field] = float(value)
+                v = float(value)
+                values[i] = v / 100.0 if is_pct and v > 1.0 else v
             
-            return FighterStats(**stats)
+            return FighterStats(*values)
         except ValueError as e:
             raise ValueError(f"Invalid input: {str(e)}")
     
     def analyze_fight(self):
         try:
             # Obter estatísticas dos lutadores
-            fighter1_stats = self.get_fighter_stats(self.fighter1_entries)
-            fighter2_stats = self.get_fighter_stats(self.fighter2_entries)
+            fighter1_stats = self.get_fighter_stats(self.fighter1_vars)
+            fighter2_stats = self.get_fighter_stats(self.fighter2_vars)
             
             # Obter nomes
             fighter1_name = self.fighter1_name.get() or "Fighter 1"
             fighter2_name = self.fighter2_name.get() or "Fighter 2"
             
-            # Calcular probabilidades
-            p, contrib = win_probability(fighter1_stats, fighter2_stats)
-            mean_p, (lo, hi) = bootstrap_probability(fighter1_stats, fighter2_stats, iters=400, noise=0.03)
-            
-            # Mostrar nome e probabilidade abaixo de cada foto
-            self.fighter1_name_result.configure(text=fighter1_name)
-            self.fighter1_prob_result.configure(text=f"{p*100:.1f}%")
-            
-            self.fighter2_name_result.configure(text=fighter2_name)
-            self.fighter2_prob_result.configure(text=f"{(1-p)*100:.1f}%")
-            
-            # Mostrar intervalo de confiança
-            self.confidence_label.configure(text=f"CI 90%: [{lo*100:.1f}% - {hi*100:.1f}%]")
-            
-            # Mostrar análise detalhada
-            detailed_text = f"Analysis Complete - {fighter1_name} vs {fighter2_name}"
-            self.detailed_label.configure(text=detailed_text, fg='#27ae60')
-            
-            # Limpar contribuições anteriores
-            for widget in self.contrib_frame.winfo_children():
-                widget.destroy()
-            
-            # Mostrar contribuições
-            contrib_title = tk.Label(self.contrib_frame, text="Feature Contributions (click for details):", 
-                                   font=("Arial", 12, "bold"),
-                                   fg='#ecf0f1', bg='#2c3e50')
-            contrib_title.pack(pady=(10, 5))
-            
-            # Botão para mostrar/ocultar contribuições detalhadas
-            self.show_details_btn = tk.Button(self.contrib_frame, text="Show Detailed Analysis", 
-                                             font=("Arial", 10),
-                                             bg='#3498db', fg='white',
-                                             command=lambda: self.toggle_contributions(contrib))
-            self.show_details_btn.pack(pady=5)
-            
-            # Frame para contribuições (inicialmente oculto)
-            self.contrib_details_frame = tk.Frame(self.contrib_frame, bg='#2c3e50')
-            self.contrib_visible = False
-            
+            # Calcular probabilidades (com cache para entradas repetidas)
+            t1 = astuple(fighter1_stats)
+            t2 = astuple(fighter2_stats)
+            p, contrib = _cached_win_probability(t1, t2)
         except Exception as e:
-            # Limpar resultados em caso de erro
-            self.confidence_label.configure(text="")
-            
-            # Limpar resultados abaixo das fotos
-            self.fighter1_name_result.configure(text="")
-            self.fighter1_prob_result.configure(text="")
-            self.fighter2_name_result.configure(text="")
-            self.fighter2_prob_result.configure(text="")
-            
-            self.detailed_label.configure(text=f"Error: {str(e)}", fg='#e74c3c')
-            messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+            self.show_analysis_error(e)
+            return
+        
+        # Nada mudou desde o último resultado exibido: não há o que recalcular
+        # (compara a própria tupla, não o hash, para uma colisão não pular a análise)
+        last_input = (t1, t2, fighter1_name, fighter2_name)
+        if last_input == self._last_input:
+            return
+        
+        # Mesmas estatísticas já analisadas nesta sessão: reaproveita o bootstrap
+        cached = _cache_get(self._bootstrap_cache, (t1, t2))
+        if cached is not None:
+            lo, hi = cached
+            self._show_results(fighter1_name, fighter2_name, p, contrib, lo, hi)
+            self._last_input = last_input
+            return
+        
+        import numpy as np
+        if self._rng is None:
+            self._rng = np.random.default_rng(seed=42)
+            self._rng_state = self._rng.bit_generator.state
+        
+        # Bootstrap roda em uma thread de trabalho e vai preenchendo o buffer;
+        # o loop do Tk mostra a estimativa parcial até terminar ou ser cancelado
+        self.analyze_btn.configure(state=tk.DISABLED)
+        self.cancel_btn.configure(state=tk.NORMAL)
+        # O que está na tela deixa de corresponder a um resultado completo
+        self._last_input = None
+        self._cancel_event = threading.Event()
+        buf = np.empty(400)
+        progress = [0]
+        self._rng.bit_generator.state = self._rng_state
+        fut = self._executor.submit(_stream_bootstrap, t1, t2, buf, progress, self._cancel_event, 0.03, self._rng)
+        self.root.after(50, self._check_future, fut, buf, progress, fighter1_name, fighter2_name, p, contrib,
+                        last_input)
+    
+    def cancel_analysis(self):
+        """Interrompe o bootstrap; o resultado parcial é mantido"""
+        self._cancel_event.set()
     
-    def toggle_contributions(self, contrib):
+    def _check_future(self, fut, buf, progress, fighter1_name, fighter2_name, p, contrib, key):
+        """Acompanha o bootstrap sem bloquear a interface"""
+        from mma_prob_model import summarize_bootstrap
+        
+        if not fut.done():
+            n = progress[0]
+            if n:
+                # Estimativa parcial só na linha do intervalo; as probabilidades dos
+                # dois lutadores mudam juntas quando o resultado fica pronto
+                mean_p, (lo, hi) = summarize_bootstrap(buf[:n])
+                self.confidence_text.set(f"~{mean_p*100:.1f}% | CI 90%: [{lo*100:.1f}% - {hi*100:.1f}%] ({n}/{len(buf)})")
+            self.root.after(50, self._check_future, fut, buf, progress, fighter1_name, fighter2_name, p, contrib, key)
+            return
+        
+        self.analyze_btn.configure(state=tk.NORMAL)
+        self.cancel_btn.configure(state=tk.DISABLED)
+        try:
+            n = fut.result()
+            if not n:
+                raise ValueError("Analysis cancelled")
+            mean_p, (lo, hi) = summarize_bootstrap(buf[:n])
+        except Exception as e:
+            self.show_analysis_error(e)
+            return
+        
+        note = ""
+        t1, t2 = key[:2]
+        if n < len(buf):
+            note = f" (cancelled after {n}/{len(buf)} samples)"
+        else:
+            # Só o bootstrap completo entra no cache
+            _cache_put(self._bootstrap_cache, (t1, t2), (lo, hi))
+            self._last_input = key
+        self._show_results(fighter1_name, fighter2_name, p, contrib, lo, hi, note)
+    
+    def _show_results(self, fighter1_name, fighter2_name, p, contrib, lo, hi, note=""):
+        """Monta o resumo das contribuições e exibe os resultados da análise"""
+        # Esconder o painel detalhado da análise anterior (widgets são reaproveitados)
+        if self.contrib_details_frame is not None:
+            self.contrib_details_frame.pack_forget()
+        
+        # Mostrar título e botão das contribuições (pack é idempotente após a primeira vez)
+        self.contrib_title.pack(pady=(10, 5))
+        self.show_details_btn.configure(text="Show Detailed Analysis")
+        self.show_details_btn.pack(pady=5)
+        
+        # Contribuições guardadas; o painel só é montado/preenchido ao ser exibido
+        self._contrib = contrib
+        self.contrib_visible = False
+        
+        self._render_results(fighter1_name, fighter2_name, p, lo, hi, note)
+    
+    def _render_results(self, fighter1_name, fighter2_name, p, lo, hi, note=""):
+        """Atualiza todos os resultados de uma vez, com um único repaint no final"""
+        # Mostrar nome e probabilidade abaixo de cada foto
+        self.fighter1_name_text.set(fighter1_name)
+        self.fighter1_prob_text.set(f"{p*100:.1f}%")
+        
+        self.fighter2_name_text.set(fighter2_name)
+        self.fighter2_prob_text.set(f"{(1-p)*100:.1f}%")
+        
+        # Mostrar intervalo de confiança
+        self.confidence_text.set(f"CI 90%: [{lo*100:.1f}% - {hi*100:.1f}%]")
+        
+        # Mostrar análise detalhada
+        detailed_text = f"Analysis Complete - {fighter1_name} vs {fighter2_name}{note}"
+        self.detailed_label.configure(text=detailed_text, fg='#27ae60')
+        
+        self.root.update_idletasks()
+    
+    def show_analysis_error(self, e):
+        self._last_input = None
+        
+        # Limpar resultados em caso de erro
+        self.confidence_text.set("")
+        
+        # Limpar resultados abaixo das fotos
+        self.fighter1_name_text.set("")
+        self.fighter1_prob_text.set("")
+        self.fighter2_name_text.set("")
+        self.fighter2_prob_text.set("")
+        
+        self.detailed_label.configure(text=f"Error: {str(e)}", fg='#e74c3c')
+        messagebox.showerror("Error", f"Analysis failed: {str(e)}")
+    
+    def _build_contrib_panel(self):
+        """Cria o painel scrollável das contribuições detalhadas (uma única vez)"""
+        self.contrib_details_frame = ttk.Frame(self.contrib_frame, style='Dark.TFrame')
+        
+        # Um único Text com tags de cor no lugar de um Label por feature
+        self.contrib_text = tk.Text(self.contrib_details_frame, height=9, font=("Arial", 10),
+                                    bg='#2c3e50', bd=0, highlightthickness=0,
+                                    padx=20, wrap=tk.NONE, cursor='arrow')
+        self.contrib_text.tag_configure('positive', foreground='#27ae60')
+        self.contrib_text.tag_configure('negative', foreground='#e74c3c')
+        contrib_scrollbar = ttk.Scrollbar(self.contrib_details_frame, orient="vertical", command=self.contrib_text.yview)
+        self.contrib_text.configure(yscrollcommand=contrib_scrollbar.set, state=tk.DISABLED)
+        
+        self.contrib_text.pack(side="left", fill="both", expand=True)
+        contrib_scrollbar.pack(side="right", fill="y")
+    
+    def fill_contributions(self, contrib):
+        """Preenche o painel com as contribuições ordenadas (um único insert)"""
+        import numpy as np
+        
+        # Filtrar e ordenar por valor absoluto no NumPy; só contribuições significativas
+        features = tuple(contrib)
+        values = np.fromiter(contrib.values(), dtype=np.float64, count=len(contrib))
+        magnitudes = np.abs(values)
+        significant = np.flatnonzero(magnitudes > 0.001)
+        order = significant[np.argsort(-magnitudes[significant], kind='stable')]
+        
+        # Pares (texto, tag) para um único insert; sem quebra de linha após a última
+        chunks = []
+        for i in order:
+            value = values[i]
+            chunks += [f"{features[i]}: {value:+.3f}\n", 'positive' if value > 0 else 'negative']
+        if chunks:
+            chunks[-2] = chunks[-2].rstrip('\n')
+        
+        self.contrib_text.configure(state=tk.NORMAL)
+        self.contrib_text.delete('1.0', tk.END)
+        if chunks:
+            self.contrib_text.insert('1.0', *chunks)
+        self.contrib_text.configure(state=tk.DISABLED)
+    
+    def toggle_contributions(self):
         """Mostra/oculta as contribuições detalhadas"""
         if not self.contrib_visible:
             # Mostrar contribuições
+            if self.contrib_details_frame is None:
+                self._build_contrib_panel()
+            self.fill_contributions(self._contrib)
             self.contrib_details_frame.pack(fill=tk.X, pady=10)
-            
-            # Criar frame scrollável para contribuições
-            contrib_canvas = tk.Canvas(self.contrib_details_frame, bg='#2c3e50', height=150)
-            contrib_scrollbar = ttk.Scrollbar(self.contrib_details_frame, orient="vertical", command=contrib_canvas.yview)
-            contrib_inner_frame = tk.Frame(contrib_canvas, bg='#2c3e50')
-            
-            contrib_inner_frame.bind(
-                "<Configure>",
-                lambda e: contrib_canvas.configure(scrollregion=contrib_canvas.bbox("all"))
-            )
-            
-            contrib_canvas.create_window((0, 0), window=contrib_inner_frame, anchor="nw")
-            contrib_canvas.configure(yscrollcommand=contrib_scrollbar.set)
-            
-            # Ordenar contribuições por valor absoluto
-            sorted_contrib = sorted(contrib.items(), key=lambda x: abs(x[1]), reverse=True)
-            
-            for feature, value in sorted_contrib:
-                if abs(value) > 0.001:  # Só mostrar contribuições significativas
-                    color = '#27ae60' if value > 0 else '#e74c3c'
-                    contrib_label = tk.Label(contrib_inner_frame, 
-                                           text=f"{feature}: {value:+.3f}",
-                                           font=("Arial", 10),
-                                           fg=color, bg='#2c3e50')
-                    contrib_label.pack(anchor=tk.W, padx=20)
-            
-            contrib_canvas.pack(side="left", fill="both", expand=True)
-            contrib_scrollbar.pack(side="right", fill="y")
-            
             self.show_details_btn.configure(text="Hide Detailed Analysis")
             self.contrib_visible = True
         else:
@@ -15,11 +15,23 @@ License: MIT
 """
 
 from __future__ import annotations
-from dataclasses import dataclass, asdict
-from typing import Dict, Tuple, List, Optional
+from dataclasses import dataclass, asdict, fields
+from typing import Dict, Tuple, List, Optional, Iterator
+from enum import IntEnum
+from functools import lru_cache
 import math
+import warnings
 import numpy as np
-import random
+
+try:
+    from numba import njit
+except ImportError:  # optional: without numba the scalar core runs as plain Python
+    njit = None
+
+try:
+    from scipy.special import expit
+except ImportError:  # optional: sigmoid_vec falls back to a NumPy expression
+    expit = None
 
 EPS = 1e-9
 
@@ -28,7 +40,7 @@ EPS = 1e-9
 # Data structures
 # -----------------------------
 
-@dataclass
+@dataclass(slots=True)
 class FighterStats:
     """
     Core statistics per fighter.
@@ -88,32 +100,27 @@ class FighterStats:
 # Feature engineering
 # -----------------------------
 
-def _clip(v, lo, hi):
-    return max(lo, min(hi, v))
-
-def _safe_div(a, b):
-    return a / (b + EPS)
-
 def fighter_feature_vector(f: FighterStats) -> Dict[str, float]:
     """
     Compute per-fighter primitive features (scale-stable where possible).
 
     Returns a dict of interpretable features.
     """
+    # Shared terms: guarded absorbed-strike denominator and clipped fight share
+    sapm1 = f.sapm + 1.0 + EPS
+    durability = max(0.0, min(1.0, f.aft_minutes/25.0))
+
     # Striking efficiency indices
     strike_output = f.slpm
-    strike_pressure = f.slpm * (1.0 - _clip(f.aft_minutes/25.0, 0, 1))
-    strike_efficiency = f.strike_acc * _safe_div(f.slpm, f.sapm + 1.0)
-    strike_safety = f.strike_def * _safe_div(1.0, f.sapm + 1.0)
+    strike_pressure = f.slpm * (1.0 - durability)
+    strike_efficiency = f.strike_acc * (f.slpm / sapm1)
+    strike_safety = f.strike_def * (1.0 / sapm1)
 
     # Grappling control indices
     td_pressure = f.td_avg15 * f.td_acc
     sub_pressure = f.sub_avg15
     kd_threat = f.kd_avg
 
-    # Durability / pacing
-    durability = _clip(f.aft_minutes/25.0, 0, 1)
-
     return {
         "strike_output": strike_output,
         "strike_pressure": strike_pressure,
@@ -139,6 +146,7 @@ def matchup_features(a: FighterStats, b: FighterStats) -> Dict[str, float]:
     strike_output_delta = fa["strike_output"] - fb["strike_output"]
     kd_delta = fa["kd_threat"] - fb["kd_threat"]
 
+    # Effective takedowns of A against B's defense, minus B's against A's
     a_td_effective = a.td_avg15 * a.td_acc * (1.0 - b.td_def)
     b_td_effective = b.td_avg15 * b.td_acc * (1.0 - a.td_def)
     td_control_delta = a_td_effective - b_td_effective
@@ -146,7 +154,9 @@ def matchup_features(a: FighterStats, b: FighterStats) -> Dict[str, float]:
     sub_delta = fa["sub_pressure"] - fb["sub_pressure"]
     durability_delta = fa["durability"] - fb["durability"]
 
-    td_vs_tdd_interaction = a.td_avg15 * a.td_acc * (1.0 - b.td_def) - b.td_avg15 * b.td_acc * (1.0 - a.td_def)
+    # Same expression as td_control_delta; kept as its own key so the two
+    # weights stay separately tunable and reported
+    td_vs_tdd_interaction = td_control_delta
 
     top10_experience_delta = fa["top10_fights"] - fb["top10_fights"]
 
@@ -183,7 +193,8 @@ DEFAULT_WEIGHTS = {
 }
 
 def dot(w: Dict[str, float], x: Dict[str, float]) -> float:
-    return sum(w.get(k, 0.0) * x.get(k, 0.0) for k in set(w) | set(x))
+    # Keys missing from x contribute 0, so only x needs to be walked
+    return sum(w.get(k, 0.0) * v for k, v in x.items())
 
 def sigmoid(z: float) -> float:
     if z >= 0:
@@ -193,36 +204,166 @@ def sigmoid(z: float) -> float:
         ez = math.exp(z)
         return ez / (1.0 + ez)
 
+def _stats_tuple(f: FighterStats) -> Tuple[float, ...]:
+    # Plain field tuple in STAT_FIELDS order (astuple deep-copies every field)
+    return (f.slpm, f.sapm, f.strike_acc, f.strike_def, f.td_avg15, f.td_acc,
+            f.td_def, f.sub_avg15, f.kd_avg, f.aft_minutes, f.top10_fights)
+
+def _fighter_terms(s):
+    """
+    Per-fighter primitives of the matchup core, from a stat tuple:
+    (strike_efficiency, strike_safety, slpm, kd_avg, td_attack, td_openness,
+    sub_avg15, durability, top10_fights).
+    """
+    slpm, sapm, sacc, sdef, tda, tdacc, tdd, sub, kd, aft, top = s
+    return (
+        sacc * (slpm / (sapm + 1.0 + EPS)),
+        sdef * (1.0 / (sapm + 1.0 + EPS)),
+        slpm,
+        kd,
+        tda * tdacc,
+        1.0 - tdd,
+        sub,
+        max(0.0, min(1.0, aft / 25.0)),
+        top,
+    )
+
+def _win_prob_core(ta, tb, w):
+    """
+    Scalar core of win_probability.
+
+    `ta`/`tb` are _fighter_terms tuples and `w` holds the weights in
+    FEATURE_KEYS order; returns P(A wins) and the per-feature contributions.
+    Only float arithmetic on fixed-length tuples (no dicts), so numba can
+    compile it when installed. Same formulas as matchup_features.
+    """
+    td_delta = ta[4] * tb[5] - tb[4] * ta[5]
+    contrib = (
+        w[0],
+        w[1] * (ta[0] - tb[0]),
+        w[2] * (ta[1] - tb[1]),
+        w[3] * (ta[2] - tb[2]),
+        w[4] * (ta[3] - tb[3]),
+        w[5] * td_delta,
+        w[6] * (ta[6] - tb[6]),
+        w[7] * (ta[7] - tb[7]),
+        w[8] * td_delta,
+        w[9] * (ta[8] - tb[8]),
+    )
+
+    z = 0.0
+    for c in contrib:
+        z += c
+    if z >= 0:
+        p = 1.0 / (1.0 + math.exp(-z))
+    else:
+        ez = math.exp(z)
+        p = ez / (1.0 + ez)
+    return p, contrib
+
+# Source of each _win_prob_core term, in FEATURE_KEYS order
+_CORE_TERMS = (
+    None,
+    "(ta[0] - tb[0])",
+    "(ta[1] - tb[1])",
+    "(ta[2] - tb[2])",
+    "(ta[3] - tb[3])",
+    "td_delta",
+    "(ta[6] - tb[6])",
+    "(ta[7] - tb[7])",
+    "td_delta",
+    "(ta[8] - tb[8])",
+)
+
+def _compile_core(w: Tuple[float, ...]):
+    """
+    _win_prob_core specialized for one weight tuple.
+
+    Weights are baked in as constants and zero-weight terms drop out of z
+    (their contribution is reported as 0.0), so a call is straight-line
+    arithmetic with no indexing into `w`. Returns f(ta, tb) -> (p, contrib).
+    """
+    w = tuple(float(c) for c in w)
+    contrib = [repr(w[0])] + [f"{c!r} * {t}" if c else "0.0" for c, t in zip(w[1:], _CORE_TERMS[1:])]
+    live = [f"c[{i}]" for i, c in enumerate(w) if c]
+    lines = ["def _core(ta, tb):"]
+    if w[5] or w[8]:
+        lines.append("    td_delta = ta[4] * tb[5] - tb[4] * ta[5]")
+    lines += [
+        f"    c = ({', '.join(contrib)},)",
+        f"    z = {' + '.join(live) or '0.0'}",
+        "    if z >= 0:",
+        "        return 1.0 / (1.0 + exp(-z)), c",
+        "    ez = exp(z)",
+        "    return ez / (1.0 + ez), c",
+    ]
+    ns = {"exp": math.exp, "inf": math.inf, "nan": math.nan}
+    exec("\n".join(lines), ns)
+    return ns["_core"]
+
+if njit is not None:
+    _fighter_terms = njit(cache=True)(_fighter_terms)
+    _win_prob_core = njit(cache=True)(_win_prob_core)
+
+# Keyed by stat values rather than stored on the (mutable) dataclass, so the
+# same fighter across rounds, repeated analyses or many pairings is computed once
+_cached_fighter_terms = lru_cache(maxsize=256)(_fighter_terms)
+
 def win_probability(a: FighterStats, b: FighterStats, weights: Dict[str, float]=None) -> Tuple[float, Dict[str,float]]:
     if weights is None:
-        weights = DEFAULT_WEIGHTS
-    feats = matchup_features(a, b)
-    z = dot(weights, feats)
-    p = sigmoid(z)
-    contrib = {k: feats.get(k,0.0) * weights.get(k,0.0) for k in feats}
-    return p, contrib
+        w = _DEFAULT_W
+    else:
+        # float() so numba sees a homogeneous tuple even for int weights
+        w = tuple(float(weights.get(k, 0.0)) for k in FEATURE_KEYS)
+    ta = _cached_fighter_terms(_stats_tuple(a))
+    tb = _cached_fighter_terms(_stats_tuple(b))
+    if w is _DEFAULT_W and _DEFAULT_CORE is not None:
+        p, contrib = _DEFAULT_CORE(ta, tb)
+    else:
+        p, contrib = _win_prob_core(ta, tb, w)
+    return p, dict(zip(FEATURE_KEYS, contrib))
 
 
 # -----------------------------
 # Optional: Calibration / Training
 # -----------------------------
 
-def fit_logistic_regression(X: np.ndarray, y: np.ndarray, l2: float=1.0, lr: float=0.05, epochs: int=1000) -> np.ndarray:
+def fit_logistic_regression(X: np.ndarray, y: np.ndarray, l2: float=1.0, lr: float=None, epochs: int=None, *, max_iter: int=50, tol: float=1e-10) -> np.ndarray:
+    """
+    L2-regularized logistic regression fitted by Newton's method (IRLS).
+
+    Minimizes mean log-loss + l2/(2N)*||w||^2. With D ~ 10 features the DxD
+    Hessian solve is negligible and convergence takes a handful of steps.
+    `lr` and `epochs` (from the former gradient-descent fit) are accepted for
+    compatibility but ignored; use `max_iter`/`tol` instead.
+    """
+    if lr is not None or epochs is not None:
+        warnings.warn("fit_logistic_regression: lr/epochs are ignored (Newton fit); use max_iter/tol",
+                      DeprecationWarning, stacklevel=2)
     N, D = X.shape
     w = np.zeros(D, dtype=float)
-    for _ in range(epochs):
-        z = X @ w
-        p = 1 / (1 + np.exp(-z))
+    ridge = l2 / N * np.eye(D)
+    for _ in range(max_iter):
+        p = sigmoid_vec(X @ w)
         grad = X.T @ (p - y) / N + l2 * w / N
-        w -= lr * grad
+        H = (X.T * (p * (1.0 - p))) @ X / N + ridge
+        # lstsq rather than solve: with l2=0 duplicated columns (td_control_delta
+        # and td_vs_tdd_interaction) make H singular
+        step = np.linalg.lstsq(H, grad, rcond=None)[0]
+        w -= step
+        if np.max(np.abs(step)) < tol:
+            break
     return w
 
 def build_design_matrix(pairs: List[Tuple[FighterStats, FighterStats]], feature_keys: List[str]) -> np.ndarray:
-    rows = []
-    for a, b in pairs:
-        feats = matchup_features(a, b)
-        rows.append([feats.get(k, 0.0) for k in feature_keys])
-    return np.array(rows, dtype=float)
+    # All pairs at once through the vectorized features; unknown keys give zero columns
+    if not pairs:
+        return np.zeros((0, len(feature_keys)))
+    A = np.array([_stats_tuple(a) for a, _ in pairs], dtype=float)
+    B = np.array([_stats_tuple(b) for _, b in pairs], dtype=float)
+    F = np.column_stack([matchup_feature_matrix(A, B), np.zeros(len(pairs))])
+    cols = [FEATURE_KEYS.index(k) if k in FEATURE_KEYS else -1 for k in feature_keys]
+    return F[:, cols]
 
 def weights_from_vector(vec: np.ndarray, feature_keys: List[str]) -> Dict[str, float]:
     return {k: float(v) for k, v in zip(feature_keys, vec)}
@@ -232,44 +373,226 @@ def weights_from_vector(vec: np.ndarray, feature_keys: List[str]) -> Dict[str, f
 # Bootstrap for simple uncertainty
 # -----------------------------
 
-def bootstrap_probability(a: FighterStats, b: FighterStats, weights: Dict[str,float]=None, iters: int=1000, noise: float=0.03, seed: int=42) -> Tuple[float, Tuple[float,float]]:
+def bootstrap_probability_iter(a: FighterStats, b: FighterStats, weights: Dict[str,float]=None, noise: float=0.03, seed: int=42, cancel=None, rng: np.random.Generator=None, block: int=64) -> Iterator[float]:
+    """
+    Endless stream of bootstrap samples of P(A wins), one per iteration.
+
+    Lets interactive callers show a running estimate and stop early; iteration
+    ends as soon as `cancel` (anything with an `is_set()` method, e.g. a
+    threading.Event) is set. A caller-owned NumPy `rng` replaces the one built
+    from `seed`. Noise is drawn `block` samples at a time from the Generator
+    rather than one Gaussian per stat per sample.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    base_a, base_b = stats_to_array(a), stats_to_array(b)
+    while True:
+        for p in _bootstrap_rows(base_a, base_b, weights, iters=block, noise=noise, rng=rng).tolist():
+            if cancel is not None and cancel.is_set():
+                return
+            yield p
+
+def summarize_bootstrap(ps) -> Tuple[float, Tuple[float,float]]:
+    """
+    Mean and ~90% interval (5th/95th order statistics) of bootstrap samples.
+    """
+    arr = np.asarray(ps, dtype=float)
+    n = len(arr)
+    k_lo, k_hi = int(0.05*n), int(0.95*n)-1
+    # Partial selection (O(n)) is enough for two order statistics
+    pivot = np.partition(arr, [k_lo, k_hi])
+    return float(arr.mean()), (float(pivot[k_lo]), float(pivot[k_hi]))
+
+
+# -----------------------------
+# Vectorized bootstrap (NumPy)
+# -----------------------------
+
+# Column order of stacked stats arrays (same as the FighterStats fields)
+STAT_FIELDS = tuple(f.name for f in fields(FighterStats))
+_PCT_COLS = [STAT_FIELDS.index(k) for k in ("strike_acc", "strike_def", "td_acc", "td_def")]
+_AFT_COL = STAT_FIELDS.index("aft_minutes")
+# Per-column upper bound of jittered stats: fractions <= 1, fight time <= 25 min
+_JITTER_MAX = np.full(len(STAT_FIELDS), np.inf)
+_JITTER_MAX[_PCT_COLS] = 1.0
+_JITTER_MAX[_AFT_COL] = 25.0
+
+def stats_to_array(f: FighterStats) -> np.ndarray:
+    return np.array(_stats_tuple(f), dtype=float)
+
+def weight_vector(weights: Dict[str, float]=None) -> np.ndarray:
+    """
+    Weights as an array aligned with FEATURE_KEYS (missing keys count as 0).
+
+    The default weights come back as a shared read-only array.
+    """
     if weights is None:
-        weights = DEFAULT_WEIGHTS
-    rng = random.Random(seed)
-    ps = []
-    for _ in range(iters):
-        def jitter(v): return max(0.0, v * (1.0 + rng.gauss(0.0, noise)))
-        aa = FighterStats(
-            slpm=jitter(a.slpm), sapm=jitter(a.sapm),
-            strike_acc=min(1.0, jitter(a.strike_acc)),
-            strike_def=min(1.0, jitter(a.strike_def)),
-            td_avg15=jitter(a.td_avg15),
-            td_acc=min(1.0, jitter(a.td_acc)),
-            td_def=min(1.0, jitter(a.td_def)),
-            sub_avg15=jitter(a.sub_avg15),
-            kd_avg=jitter(a.kd_avg),
-            aft_minutes=min(25.0, jitter(a.aft_minutes)),
-            top10_fights=jitter(a.top10_fights),
-        )
-        bb = FighterStats(
-            slpm=jitter(b.slpm), sapm=jitter(b.sapm),
-            strike_acc=min(1.0, jitter(b.strike_acc)),
-            strike_def=min(1.0, jitter(b.strike_def)),
-            td_avg15=jitter(b.td_avg15),
-            td_acc=min(1.0, jitter(b.td_acc)),
-            td_def=min(1.0, jitter(b.td_def)),
-            sub_avg15=jitter(b.sub_avg15),
-            kd_avg=jitter(b.kd_avg),
-            aft_minutes=min(25.0, jitter(b.aft_minutes)),
-            top10_fights=jitter(b.top10_fights),
-        )
-        p, _ = win_probability(aa, bb, weights)
-        ps.append(p)
-    ps.sort()
-    mean_p = sum(ps)/len(ps)
-    lo = ps[int(0.05*len(ps))]
-    hi = ps[int(0.95*len(ps))-1]
-    return mean_p, (lo, hi)
+        return _DEFAULT_W_VEC
+    return np.array([weights.get(k, 0.0) for k in FEATURE_KEYS], dtype=float)
+
+def sigmoid_vec(z: np.ndarray) -> np.ndarray:
+    # Branch-free logistic for arrays; the tanh form never overflows and needs
+    # a single transcendental per element
+    if expit is not None:
+        return expit(z)
+    return 0.5 * (1.0 + np.tanh(0.5 * z))
+
+def matchup_feature_matrix(A: np.ndarray, B: np.ndarray) -> np.ndarray:
+    """
+    Row-wise matchup_features for stacked stats.
+
+    A and B have shape (n, len(STAT_FIELDS)); the result has shape
+    (n, len(FEATURE_KEYS)) with columns in FEATURE_KEYS order.
+    """
+    a = dict(zip(STAT_FIELDS, A.T))
+    b = dict(zip(STAT_FIELDS, B.T))
+
+    def strike_efficiency(f): return f["strike_acc"] * (f["slpm"] / (f["sapm"] + 1.0 + EPS))
+    def strike_safety(f): return f["strike_def"] * (1.0 / (f["sapm"] + 1.0 + EPS))
+    def durability(f): return np.clip(f["aft_minutes"]/25.0, 0, 1)
+
+    td_delta = a["td_avg15"] * a["td_acc"] * (1.0 - b["td_def"]) - b["td_avg15"] * b["td_acc"] * (1.0 - a["td_def"])
+    cols = {
+        "bias": np.ones(len(A)),
+        "strike_eff_delta": strike_efficiency(a) - strike_efficiency(b),
+        "strike_safety_delta": strike_safety(a) - strike_safety(b),
+        "strike_output_delta": a["slpm"] - b["slpm"],
+        "kd_delta": a["kd_avg"] - b["kd_avg"],
+        "td_control_delta": td_delta,
+        "sub_delta": a["sub_avg15"] - b["sub_avg15"],
+        "durability_delta": durability(a) - durability(b),
+        "td_vs_tdd_interaction": td_delta,
+        "top10_experience_delta": a["top10_fights"] - b["top10_fights"],
+    }
+    return np.column_stack([cols[k] for k in FEATURE_KEYS])
+
+def _jitter_pair(a: np.ndarray, b: np.ndarray, iters: int, noise: float, rng: np.random.Generator) -> Tuple[np.ndarray, np.ndarray]:
+    # One Generator draw of shape (iters, 2, n_stats) for both fighters, then
+    # scaled and clipped in place in that same buffer
+    X = rng.normal(1.0, noise, size=(iters, 2, a.size))
+    X *= np.stack([a, b])
+    np.clip(X, 0.0, _JITTER_MAX, out=X)
+    return X[:, 0], X[:, 1]
+
+def bootstrap_samples(a: FighterStats, b: FighterStats, weights: Dict[str,float]=None, iters: int=1000, noise: float=0.03, rng: np.random.Generator=None) -> np.ndarray:
+    """
+    `iters` bootstrap samples of P(A wins), drawn all at once.
+
+    Each fighter is perturbed as one (iters, n_stats) matrix (multiplicative
+    Gaussian noise, fractions clipped to 1, fight time to 25 min) and scored
+    with a single matrix-vector product. Pass the same `rng` to draw in chunks.
+    """
+    return _bootstrap_rows(stats_to_array(a), stats_to_array(b), weights, iters, noise, rng)
+
+def _bootstrap_rows(a: np.ndarray, b: np.ndarray, weights: Dict[str,float]=None, iters: int=1000, noise: float=0.03, rng: np.random.Generator=None) -> np.ndarray:
+    # bootstrap_samples on stat rows (STAT_FIELDS order)
+    if rng is None:
+        rng = np.random.default_rng(42)
+    A, B = _jitter_pair(a, b, iters, noise, rng)
+    return sigmoid_vec(matchup_feature_matrix(A, B) @ weight_vector(weights))
+
+def bootstrap_probability(a: FighterStats, b: FighterStats, weights: Dict[str,float]=None, iters: int=1000, noise: float=0.03, seed: int=42, rng: np.random.Generator=None) -> Tuple[float, Tuple[float,float]]:
+    """
+    Mean and ~90% interval of P(A wins) under multiplicative stat noise.
+
+    All `iters` samples are drawn and scored in one vectorized pass
+    (bootstrap_samples); a caller-owned NumPy `rng` replaces the one built from `seed`.
+    """
+    if rng is None:
+        rng = np.random.default_rng(seed)
+    ps = bootstrap_samples(a, b, weights, iters=iters, noise=noise, rng=rng)
+    return summarize_bootstrap(ps)
+
+def win_probability_batch(fighters: List[FighterStats], weights: Dict[str,float]=None) -> np.ndarray:
+    """
+    Pairwise win probabilities for a pool of fighters.
+
+    Returns P with shape (N, N), P[i, j] = P(fighters[i] beats fighters[j]).
+    Every feature except the takedown terms is a plain A-minus-B difference,
+    so its weighted sum splits into a per-fighter score s and the matrix is
+    bias + s[i] - s[j] + the takedown interaction, all in one NumPy pass.
+    """
+    S = np.array([_stats_tuple(f) for f in fighters], dtype=float).reshape(-1, len(STAT_FIELDS))
+    return _pairwise_probabilities(S, weights)
+
+def _pairwise_probabilities(S: np.ndarray, weights: Dict[str,float]=None) -> np.ndarray:
+    # win_probability_batch on a stacked (N, len(STAT_FIELDS)) stats array
+    w = weight_vector(weights)
+    f = dict(zip(STAT_FIELDS, S.T))
+
+    # Per-fighter primitives of the difference features, in FEATURE_KEYS order
+    idx = [Feat.STRIKE_EFF_DELTA, Feat.STRIKE_SAFETY_DELTA, Feat.STRIKE_OUTPUT_DELTA,
+           Feat.KD_DELTA, Feat.SUB_DELTA, Feat.DURABILITY_DELTA, Feat.TOP10_EXPERIENCE_DELTA]
+    T = np.column_stack([
+        f["strike_acc"] * (f["slpm"] / (f["sapm"] + 1.0 + EPS)),
+        f["strike_def"] * (1.0 / (f["sapm"] + 1.0 + EPS)),
+        f["slpm"],
+        f["kd_avg"],
+        f["sub_avg15"],
+        np.clip(f["aft_minutes"]/25.0, 0, 1),
+        f["top10_fights"],
+    ])
+    score = T @ w[idx]
+
+    # Effective takedowns of i against j, minus those of j against i
+    td_attack = f["td_avg15"] * f["td_acc"]
+    td_open = 1.0 - f["td_def"]
+    td_delta = np.outer(td_attack, td_open) - np.outer(td_open, td_attack)
+    w_td = w[Feat.TD_CONTROL_DELTA] + w[Feat.TD_VS_TDD_INTERACTION]
+
+    Z = w[Feat.BIAS] + (score[:, None] - score[None, :]) + w_td * td_delta
+    return sigmoid_vec(Z)
+
+
+
+# -----------------------------
+# Fighter roster (struct of arrays)
+# -----------------------------
+
+class FighterRoster:
+    """
+    A pool of fighters stored column-wise: one contiguous float array of
+    shape (N, len(STAT_FIELDS)) plus the fighter names.
+
+    Batch paths (pairwise probabilities, bootstrap) read the rows directly
+    instead of repacking FighterStats objects on every call.
+    """
+
+    def __init__(self, names: List[str], stats: np.ndarray):
+        stats = np.ascontiguousarray(stats, dtype=float)
+        if stats.ndim != 2 or stats.shape != (len(names), len(STAT_FIELDS)):
+            raise ValueError(f"stats must have shape ({len(names)}, {len(STAT_FIELDS)}), got {stats.shape}")
+        self.names = list(names)
+        self.stats = stats
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    @classmethod
+    def from_fighters(cls, fighters: Dict[str, FighterStats]) -> "FighterRoster":
+        stats = np.array([_stats_tuple(f) for f in fighters.values()], dtype=float)
+        return cls(list(fighters), stats.reshape(-1, len(STAT_FIELDS)))
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    def index(self, fighter) -> int:
+        """Row of a fighter given by name or row number."""
+        return self._index[fighter] if isinstance(fighter, str) else int(fighter)
+
+    def __getitem__(self, fighter) -> FighterStats:
+        return FighterStats(*self.stats[self.index(fighter)].tolist())
+
+    def win_probability(self, a, b, weights: Dict[str,float]=None) -> Tuple[float, Dict[str,float]]:
+        return win_probability(self[a], self[b], weights)
+
+    def win_probabilities(self, weights: Dict[str,float]=None) -> np.ndarray:
+        """P[i, j] = P(fighter i beats fighter j) for the whole roster."""
+        return _pairwise_probabilities(self.stats, weights)
+
+    def bootstrap_probability(self, a, b, weights: Dict[str,float]=None, iters: int=1000, noise: float=0.03, seed: int=42, rng: np.random.Generator=None) -> Tuple[float, Tuple[float,float]]:
+        if rng is None:
+            rng = np.random.default_rng(seed)
+        ps = _bootstrap_rows(self.stats[self.index(a)], self.stats[self.index(b)], weights, iters=iters, noise=noise, rng=rng)
+        return summarize_bootstrap(ps)
 
 
 # -----------------------------
@@ -289,6 +612,18 @@ FEATURE_KEYS = [
     "top10_experience_delta",
 ]
 
+# Positional index of each feature in FEATURE_KEYS order (Feat.KD_DELTA == 4, ...)
+Feat = IntEnum("Feat", [k.upper() for k in FEATURE_KEYS], start=0)
+
+# DEFAULT_WEIGHTS folded once into FEATURE_KEYS order: a tuple for the scalar
+# core and a frozen array for the vectorized paths
+_DEFAULT_W = tuple(DEFAULT_WEIGHTS[k] for k in FEATURE_KEYS)
+_DEFAULT_W_VEC = np.array(_DEFAULT_W)
+_DEFAULT_W_VEC.flags.writeable = False
+# Plain-Python core with the default weights baked in (numba already
+# specializes the generic one when installed)
+_DEFAULT_CORE = _compile_core(_DEFAULT_W) if njit is None else None
+
 def explain(a: FighterStats, b: FighterStats, weights: Dict[str,float]=None) -> Dict[str, float]:
     if weights is None:
         weights = DEFAULT_WEIGHTS
@@ -1,6 +1,11 @@
 import matplotlib.pyplot as plt
 import numpy as np
-from mma_prob_model import FighterStats, win_probability, DEFAULT_WEIGHTS
+from mma_prob_model import (FighterStats, DEFAULT_WEIGHTS, Feat, weight_vector,
+                            stats_to_array, matchup_feature_matrix, sigmoid_vec)
+
+# Pesos reforçados nos rounds iniciais (1-2) e nos médios/finais (3+)
+EARLY_ROUND_BOOST = {"td_control_delta": 1.3, "td_vs_tdd_interaction": 1.3, "sub_delta": 1.3}
+LATE_ROUND_BOOST = {"durability_delta": 1.5, "strike_output_delta": 1.3, "strike_safety_delta": 1.2}
 
 
 def round_adjusted_weights(round_num: int, f1: FighterStats = None, f2: FighterStats = None, base_weights: dict = None) -> dict:
@@ -23,27 +28,35 @@ def round_adjusted_weights(round_num: int, f1: FighterStats = None, f2: FighterS
     f1_fatigue = fatigue_factor(f1, round_num) if f1 else 1.0
     f2_fatigue = fatigue_factor(f2, round_num) if f2 else 1.0
 
-    if round_num <= 2:
-        w["td_control_delta"] *= 1.3 * f1_fatigue
-        w["td_vs_tdd_interaction"] *= 1.3 * f1_fatigue
-        w["sub_delta"] *= 1.3 * f1_fatigue
-    elif round_num >= 3:
-        w["durability_delta"] *= 1.5 * f1_fatigue
-        w["strike_output_delta"] *= 1.3 * f1_fatigue
-        w["strike_safety_delta"] *= 1.2 * f1_fatigue
+    boost = EARLY_ROUND_BOOST if round_num <= 2 else LATE_ROUND_BOOST
+    for k, factor in boost.items():
+        w[k] *= factor * f1_fatigue
 
     return w
 
 def round_win_probs(f1: FighterStats, f2: FighterStats, total_rounds: int = 5):
     """
     Calcula a probabilidade de vitória de f1 contra f2 em cada round.
+
+    Mesmos pesos de round_adjusted_weights, mas todos os rounds de uma vez:
+    uma matriz de pesos (rounds x features) contra o vetor de features da luta.
     """
-    probs = []
-    for r in range(1, total_rounds + 1):
-        w = round_adjusted_weights(r, f1=f1, f2=f2)
-        p, _ = win_probability(f1, f2, weights=w)
-        probs.append(p)
-    return probs
+    rounds = np.arange(1, total_rounds + 1)
+    base_endurance = f1.aft_minutes / 15  # normaliza para 5 rounds de 5 minutos
+    if base_endurance == 0:
+        # Como no fatigue_factor escalar: erro explícito em vez de NaN silencioso do NumPy
+        raise ZeroDivisionError("float division by zero")
+    fatigue = np.maximum(0.5, 1 - (rounds - 1) * 0.15 / base_endurance)
+
+    W = np.tile(weight_vector(), (total_rounds, 1))
+    early = rounds <= 2
+    for boost, mask in ((EARLY_ROUND_BOOST, early), (LATE_ROUND_BOOST, ~early)):
+        for k, factor in boost.items():
+            W[mask, Feat[k.upper()]] *= factor * fatigue[mask]
+
+    # Features da luta calculadas uma única vez
+    feats = matchup_feature_matrix(stats_to_array(f1)[None, :], stats_to_array(f2)[None, :])[0]
+    return sigmoid_vec(W @ feats).tolist()
 
 def plot_round_probs(f1_name, f2_name, probs):
     rounds = np.arange(1, len(probs)+1)
@@ -0,0 +1,85 @@
+"""
+The matchup formulas live in several hand-specialized copies (dict features,
+scalar core, generated core, feature matrix, pairwise batch). These tests
+check on random fighters that they all agree.
+
+Run from the repository root: python -m unittest discover tests
+"""
+
+import unittest
+
+import numpy as np
+
+import mma_prob_model as m
+
+
+def random_fighters(n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        m.FighterStats(
+            slpm=rng.uniform(0, 8), sapm=rng.uniform(0, 7),
+            strike_acc=rng.uniform(0, 1), strike_def=rng.uniform(0, 1),
+            td_avg15=rng.uniform(0, 7), td_acc=rng.uniform(0, 1), td_def=rng.uniform(0, 1),
+            sub_avg15=rng.uniform(0, 5), kd_avg=rng.uniform(0, 2),
+            aft_minutes=rng.uniform(0, 30), top10_fights=float(rng.integers(0, 10)),
+        )
+        for _ in range(n)
+    ]
+
+
+def random_weights(seed):
+    rng = np.random.default_rng(seed)
+    w = {k: float(rng.normal()) for k in m.FEATURE_KEYS}
+    w["kd_delta"] = 0.0  # zero weights drop out of the generated core
+    return w
+
+
+class ModelConsistencyTest(unittest.TestCase):
+    def setUp(self):
+        self.fighters = random_fighters(40)
+        self.pairs = list(zip(self.fighters[::2], self.fighters[1::2]))
+        self.weight_sets = [None, random_weights(1), random_weights(2)]
+
+    def test_win_probability_matches_dict_features(self):
+        for weights in self.weight_sets:
+            w = m.DEFAULT_WEIGHTS if weights is None else weights
+            for a, b in self.pairs:
+                feats = m.matchup_features(a, b)
+                p, contrib = m.win_probability(a, b, weights)
+                self.assertAlmostEqual(p, m.sigmoid(m.dot(w, feats)), places=12)
+                for k in m.FEATURE_KEYS:
+                    self.assertAlmostEqual(contrib[k], w[k] * feats[k], places=12)
+
+    def test_feature_matrix_matches_dict_features(self):
+        A = np.array([m.stats_to_array(a) for a, _ in self.pairs])
+        B = np.array([m.stats_to_array(b) for _, b in self.pairs])
+        F = m.matchup_feature_matrix(A, B)
+        expected = [[m.matchup_features(a, b)[k] for k in m.FEATURE_KEYS] for a, b in self.pairs]
+        np.testing.assert_allclose(F, expected, rtol=1e-12, atol=1e-12)
+
+    def test_batch_matches_win_probability(self):
+        for weights in self.weight_sets:
+            P = m.win_probability_batch(self.fighters, weights)
+            expected = [[m.win_probability(a, b, weights)[0] for b in self.fighters] for a in self.fighters]
+            np.testing.assert_allclose(P, expected, rtol=1e-12, atol=1e-12)
+
+    def test_roster_matches_batch(self):
+        roster = m.FighterRoster.from_fighters({f"f{i}": f for i, f in enumerate(self.fighters)})
+        np.testing.assert_allclose(roster.win_probabilities(), m.win_probability_batch(self.fighters),
+                                   rtol=1e-12, atol=1e-12)
+
+    def test_generated_core_matches_generic_core(self):
+        for weights in self.weight_sets:
+            w = m._DEFAULT_W if weights is None else tuple(weights[k] for k in m.FEATURE_KEYS)
+            core = m._compile_core(w)
+            for a, b in self.pairs:
+                ta = m._fighter_terms(m._stats_tuple(a))
+                tb = m._fighter_terms(m._stats_tuple(b))
+                p, contrib = core(ta, tb)
+                p_ref, contrib_ref = m._win_prob_core(ta, tb, w)
+                self.assertAlmostEqual(p, p_ref, places=12)
+                np.testing.assert_allclose(contrib, contrib_ref, rtol=1e-12, atol=1e-12)
+
+
+if __name__ == "__main__":
+    unittest.main()
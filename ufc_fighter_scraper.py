@@ -2,20 +2,131 @@ import requests
 from bs4 import BeautifulSoup
 import re
 import json
-from typing import Dict, Optional
+import os
+import importlib.util
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+# Parser em C (lxml) quando instalado; senão o html.parser puro Python
+HTML_PARSER = 'lxml' if importlib.util.find_spec('lxml') else 'html.parser'
+
+# Seletores CSS usados na página do atleta
+NAME_SELECTORS = ('h1.hero-profile__name', '.hero-profile__name', 'h1')
+IMAGE_SELECTORS = (
+    '.hero-profile__image img',
+    '.hero-profile__image-wrap img',
+    '.athlete-image img',
+    '.hero-image img',
+    'img[alt*="headshot"]',
+    'img[src*="headshot"]',
+    '.athlete-headshot img',
+    '.fighter-image img',
+    'img[src*="athlete"]',
+    'img[src*="fighter"]',
+)
+CHART_SELECTOR = 'svg.e-chart-circle'
+STAT_GROUP_SELECTOR = 'div[class*="c-stat-compare__group"]'
+
+# Limpeza de números ("5,36" -> "5.36") e tempos ("13:45") compilada uma vez
+_NON_NUMERIC_RE = re.compile(r'[^\d.,]')
+_NON_TIME_RE = re.compile(r'[^\d:]')
+_COMMA_TO_DOT = str.maketrans(',', '.')
+
+# Tempo máximo de espera pela página do atleta (segundos)
+REQUEST_TIMEOUT = 10
+
+# Validade dos dados em cache (segundos); depois disso a página é buscada de novo
+CACHE_TTL = 3600
 
 class UFCFighterScraper:
-    def __init__(self):
-        self.session = requests.Session()
+    def __init__(self, session: Optional[requests.Session] = None, cache_size: int = 512,
+                 cache_ttl: float = CACHE_TTL, cache_file: Optional[str] = None):
+        # Uma sessão externa (ex.: a da GUI) permite compartilhar o pool de conexões
+        self.session = session if session is not None else requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         })
+        # Cache LRU por URL (só resultados válidos) com validade de cache_ttl segundos;
+        # protegido por lock para uso em threads. Entradas: url -> (expira_em, dados)
+        self._cache = OrderedDict()
+        self._cache_size = cache_size
+        self._cache_ttl = cache_ttl
+        self._cache_lock = threading.Lock()
+        # Arquivo JSON opcional para o cache sobreviver entre execuções
+        self._cache_file = cache_file
+        if cache_file:
+            self._load_cache()
 
     def get_fighter_data(self, fighter_url: str) -> Dict:
+        # Chave sem espaços, barra final ou maiúsculas: variações da mesma URL usam a mesma entrada
+        key = fighter_url.strip().rstrip('/').lower()
+        with self._cache_lock:
+            cached = self._cache.get(key)
+            if cached is not None:
+                if cached[0] > time.time():
+                    self._cache.move_to_end(key)
+                    return cached[1]
+                del self._cache[key]
+
+        data = self._fetch_fighter_data(fighter_url)
+        if data:
+            with self._cache_lock:
+                self._cache[key] = (time.time() + self._cache_ttl, data)
+                self._cache.move_to_end(key)
+                if len(self._cache) > self._cache_size:
+                    self._cache.popitem(last=False)
+            if self._cache_file:
+                self._save_cache()
+        return data
+
+    def _load_cache(self):
+        """Carrega do arquivo as entradas ainda válidas"""
         try:
-            response = self.session.get(fighter_url)
+            with open(self._cache_file, encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(entries, dict):
+            return
+        now = time.time()
+        with self._cache_lock:
+            for url, entry in entries.items():
+                # Ignora entradas fora do formato [expira_em, {dados}]
+                if not (isinstance(entry, list) and len(entry) == 2):
+                    continue
+                expires, data = entry
+                if isinstance(expires, (int, float)) and isinstance(data, dict) and data and expires > now:
+                    self._cache[url] = (expires, data)
+            while len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _save_cache(self):
+        """Grava o cache no arquivo (via arquivo temporário, para não deixar JSON pela metade)"""
+        with self._cache_lock:
+            entries = dict(self._cache)
+        tmp = f"{self._cache_file}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(entries, f, ensure_ascii=False)
+            os.replace(tmp, self._cache_file)
+        except OSError:
+            pass
+
+    def get_fighters_data(self, fighter_urls: List[str], max_workers: int = 8) -> List[Dict]:
+        """Busca vários lutadores em paralelo (a sessão é compartilhada entre as threads)"""
+        if not fighter_urls:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(fighter_urls))) as executor:
+            return list(executor.map(self.get_fighter_data, fighter_urls))
+
+    def _fetch_fighter_data(self, fighter_url: str) -> Dict:
+        try:
+            response = self.session.get(fighter_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, HTML_PARSER)
             
             name = self._extract_fighter_name(soup)
             image_url = self._extract_fighter_image(soup)
@@ -31,8 +142,7 @@ class UFCFighterScraper:
             return {}
 
     def _extract_fighter_name(self, soup: BeautifulSoup) -> str:
-        name_selectors = ['h1.hero-profile__name', '.hero-profile__name', 'h1']
-        for selector in name_selectors:
+        for selector in NAME_SELECTORS:
             name_element = soup.select_one(selector)
             if name_element:
                 return name_element.get_text(strip=True)
@@ -40,22 +150,9 @@ class UFCFighterScraper:
 
     def _extract_fighter_image(self, soup: BeautifulSoup) -> str:
         """Extrai a URL da imagem do lutador"""
-        image_selectors = [
-            '.hero-profile__image img',
-            '.hero-profile__image-wrap img',
-            '.athlete-image img',
-            '.hero-image img',
-            'img[alt*="headshot"]',
-            'img[src*="headshot"]',
-            '.athlete-headshot img',
-            '.fighter-image img',
-            'img[src*="athlete"]',
-            'img[src*="fighter"]'
-        ]
-        
         found_urls = []
         
-        for selector in image_selectors:
+        for selector in IMAGE_SELECTORS:
             img_elements = soup.select(selector)
             for img_element in img_elements:
                 src = img_element.get('src')
@@ -92,7 +189,7 @@ class UFCFighterScraper:
         }
         
         # Precisão de striking e takedown dos gráficos circulares
-        charts = soup.find_all('svg', class_='e-chart-circle')
+        charts = soup.select(CHART_SELECTOR)
         for chart in charts:
             title = chart.find('title')
             if title:
@@ -109,7 +206,7 @@ class UFCFighterScraper:
                         pass
         
         # Estatísticas dos grupos
-        all_groups = soup.find_all('div', class_=re.compile(r'c-stat-compare__group'))
+        all_groups = soup.select(STAT_GROUP_SELECTOR)
         for group in all_groups:
             number_elem = group.find('div', class_='c-stat-compare__number')
             label_elem = group.find('div', class_='c-stat-compare__label')
@@ -147,18 +244,17 @@ class UFCFighterScraper:
 
     def _extract_numeric_value(self, text: str) -> Optional[float]:
         try:
-            numeric_text = re.sub(r'[^\d.,]', '', text.replace(',', '.'))
+            numeric_text = _NON_NUMERIC_RE.sub('', text.translate(_COMMA_TO_DOT))
             return float(numeric_text) if numeric_text else None
         except:
             return None
 
     def _convert_time_to_minutes(self, time_text: str) -> Optional[float]:
         try:
-            clean_time = re.sub(r'[^\d:]', '', time_text)
-            if ':' in clean_time:
-                parts = clean_time.split(':')
-                if len(parts) == 2:
-                    return int(parts[0]) + (int(parts[1]) / 60.0)
+            clean_time = _NON_TIME_RE.sub('', time_text)
+            minutes, sep, seconds = clean_time.partition(':')
+            if sep and ':' not in seconds:
+                return int(minutes) + (int(seconds) / 60.0)
             return self._extract_numeric_value(time_text)
         except:
             return None